@@ -3,7 +3,9 @@
 import os
 import time
 import json
+import asyncio
 import tempfile
+import threading
 import traceback
 import requests
 import yfinance as yf
@@ -19,6 +21,7 @@ except ImportError:
     print("⚠️ matplotlib not installed; /chart commands will be disabled")
 
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 # ── CONFIG ─────────────────────────────────────────────────────────────────────
 TOKEN = os.getenv("TELEGRAM_TOKEN")
@@ -32,12 +35,29 @@ dp = Dispatcher(bot)
 # NewsAPI.org key (set this in Railway or your environment)
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
-CRYPTO_IDS    = [
-    "bitcoin", "ethereum", "ripple", "hedera-hashgraph",
-    "stellar", "quant-network", "ondo", "xdc-network",
-    "pepe", "shiba-inu", "solana", "dogecoin",
-]
-STOCK_TICKERS = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL"]
+# Asset lists live in symbols.py so the page generator can share them
+from symbols import CRYPTO_ASSETS, STOCK_ASSETS, CRYPTO_IDS, STOCK_TICKERS
+from state import save_state, load_state
+
+# Inline mode tuning
+SNAPSHOT_REFRESH_SECONDS = 60    # how often the in-memory price snapshot is refreshed
+INLINE_CACHE_TIME        = 30    # seconds Telegram may cache an inline answer
+INLINE_DEBOUNCE_SECONDS  = 0.3   # per-user quiet period before answering a keystroke
+INLINE_MAX_RESULTS       = 50    # Telegram's limit per inline answer
+STOCK_BATCH_SIZE         = 100   # tickers per yf.download call when refreshing the snapshot
+PRICE_MAX_AGE            = 300   # snapshot prices older than this are re-fetched by /crypto and /stocks
+
+# Warm restarts: hot caches are checkpointed here and reloaded on startup.
+# STATE_DIR must be a persistent volume (Railway sets RAILWAY_VOLUME_MOUNT_PATH
+# when one is attached; see bot/README.md), otherwise every deploy starts cold.
+STATE_DIR          = os.getenv("STATE_DIR") or os.getenv("RAILWAY_VOLUME_MOUNT_PATH") or "/data"
+STATE_FILE         = os.getenv("STATE_FILE", os.path.join(STATE_DIR, "bot_state.bin"))
+CHECKPOINT_SECONDS = 60     # how often the caches are written to STATE_FILE
+HISTORY_TTL        = 600    # chart data older than this is revalidated in the background
+NEWS_TTL           = 900    # news results older than this are revalidated in the background
+# Chart periods worth caching; other periods are fetched on demand so user
+# input can't grow the caches (and the checkpoint) without bound
+CACHED_CHART_PERIODS = {"1d", "5d", "7d", "14d", "30d", "90d", "180d", "365d", "1mo", "3mo", "6mo", "1y"}
 
 # ── HELPER FUNCTIONS ─────────────────────────────────────────────────────────────
 def format_price(price: float) -> str:
@@ -111,20 +131,43 @@ def get_stock_price_single(ticker: str) -> str:
         return f"{ticker.upper()}: Error fetching price"
 
 def get_crypto_prices() -> str:
-    try:
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        response = requests.get(url, params={"ids": ",".join(CRYPTO_IDS), "vs_currencies": "usd"}, timeout=15)
-        
-        # Check if the request was successful
-        if response.status_code != 200:
-            return f"⚠️ API Error ({response.status_code}): Unable to fetch crypto prices"
-        
-        data = response.json()
-        
-        # Check if the response contains the expected data structure
-        if not isinstance(data, dict):
-            return "⚠️ Invalid API response: Unable to parse crypto price data"
+    # Serve from the price snapshot; only symbols it lacks (or holds stale) go upstream
+    missing = [cid for cid in CRYPTO_IDS if not is_fresh_price(cid)]
+    data = {}
+    if missing:
+        error = None
+        try:
+            url = "https://api.coingecko.com/api/v3/simple/price"
+            response = requests.get(url, params={"ids": ",".join(missing), "vs_currencies": "usd"}, timeout=15)
+            
+            # Check if the request was successful
+            if response.status_code != 200:
+                error = f"⚠️ API Error ({response.status_code}): Unable to fetch crypto prices"
+            else:
+                data = response.json()
+                
+                # Check if the response contains the expected data structure
+                if not isinstance(data, dict):
+                    error = "⚠️ Invalid API response: Unable to parse crypto price data"
+        except requests.exceptions.Timeout:
+            error = "⚠️ Request timeout: API took too long to respond"
+        except requests.exceptions.ConnectionError:
+            error = "⚠️ Connection error: Unable to reach the API server"
+        except requests.exceptions.RequestException as e:
+            error = f"⚠️ Network error: {str(e)}"
+        except ValueError as e:
+            error = f"⚠️ Data parsing error: {str(e)}"
+        except Exception as e:
+            traceback.print_exc()
+            error = f"⚠️ Unexpected error: {str(e)}"
         
+        if error:
+            # Nothing cached to fall back on
+            if not any(cid in PRICE_SNAPSHOT for cid in CRYPTO_IDS):
+                return error
+            data = None
+    
+    try:
         lines = []
         successful_prices = 0
         total_cryptos = len(CRYPTO_IDS)
@@ -132,21 +175,29 @@ def get_crypto_prices() -> str:
         for cid in CRYPTO_IDS:
             name = cid.replace("-", " ").title()
             
-            # Check if the crypto exists in the response
-            if cid not in data:
-                lines.append(f"{name}: Symbol not found")
-                continue
-            
-            price = data[cid].get("usd")
+            if not is_fresh_price(cid):
+                # Check if the crypto exists in the response; failures fall
+                # back to a dated snapshot price when there is one
+                if data is None:
+                    lines.append(format_price_card(cid, dated=True) or f"{name}: Price unavailable")
+                    continue
+                if cid not in data:
+                    lines.append(format_price_card(cid, dated=True) or f"{name}: Symbol not found")
+                    continue
+                
+                price = data[cid].get("usd")
+                
+                # Check if price is None, 0, or negative
+                if price is None:
+                    lines.append(format_price_card(cid, dated=True) or f"{name}: Price unavailable")
+                    continue
+                elif price <= 0:
+                    lines.append(format_price_card(cid, dated=True) or f"{name}: Invalid price data")
+                    continue
+                PRICE_SNAPSHOT[cid] = {"price": price, "updated": time.time()}
             
-            # Check if price is None, 0, or negative
-            if price is None:
-                lines.append(f"{name}: Price unavailable")
-            elif price <= 0:
-                lines.append(f"{name}: Invalid price data")
-            else:
-                lines.append(f"{name}: {format_price(price)}")
-                successful_prices += 1
+            lines.append(format_price_card(cid))
+            successful_prices += 1
         
         # Add summary if some prices failed
         summary = ""
@@ -158,12 +209,6 @@ def get_crypto_prices() -> str:
         
         return "📊 *Crypto Prices*\n" + "\n".join(lines) + summary
         
-    except requests.exceptions.Timeout:
-        return "⚠️ Request timeout: API took too long to respond"
-    except requests.exceptions.ConnectionError:
-        return "⚠️ Connection error: Unable to reach the API server"
-    except requests.exceptions.RequestException as e:
-        return f"⚠️ Network error: {str(e)}"
     except (ValueError, KeyError, TypeError) as e:
         return f"⚠️ Data parsing error: {str(e)}"
     except Exception as e:
@@ -177,28 +222,35 @@ def get_stock_prices() -> str:
         total_stocks = len(STOCK_TICKERS)
         
         for t in STOCK_TICKERS:
-            try:
-                ticker_obj = yf.Ticker(t)
-                info = ticker_obj.info
-                
-                # Check if we got valid info
-                if not info or not isinstance(info, dict):
-                    lines.append(f"{t}: Invalid ticker data")
-                    continue
-                
-                price = info.get("regularMarketPrice")
-                
-                # Check if price is None, 0, or negative
-                if price is None:
-                    lines.append(f"{t}: Price unavailable")
-                elif price <= 0:
-                    lines.append(f"{t}: Invalid price data")
-                else:
-                    lines.append(f"{t}: ${price:,.2f}")
-                    successful_prices += 1
+            # Serve from the price snapshot; only tickers it lacks (or holds
+            # stale) go upstream, and failures fall back to a dated snapshot price
+            if not is_fresh_price(t):
+                try:
+                    ticker_obj = yf.Ticker(t)
+                    info = ticker_obj.info
+                    
+                    # Check if we got valid info
+                    if not info or not isinstance(info, dict):
+                        lines.append(format_price_card(t, dated=True) or f"{t}: Invalid ticker data")
+                        continue
                     
-            except Exception as e:
-                lines.append(f"{t}: Error fetching price")
+                    price = info.get("regularMarketPrice")
+                    
+                    # Check if price is None, 0, or negative
+                    if price is None:
+                        lines.append(format_price_card(t, dated=True) or f"{t}: Price unavailable")
+                        continue
+                    elif price <= 0:
+                        lines.append(format_price_card(t, dated=True) or f"{t}: Invalid price data")
+                        continue
+                    PRICE_SNAPSHOT[t] = {"price": price, "updated": time.time()}
+                        
+                except Exception as e:
+                    lines.append(format_price_card(t, dated=True) or f"{t}: Error fetching price")
+                    continue
+            
+            lines.append(format_price_card(t))
+            successful_prices += 1
         
         # Add summary if some prices failed
         summary = ""
@@ -214,8 +266,90 @@ def get_stock_prices() -> str:
         traceback.print_exc()
         return f"⚠️ Error fetching all stock prices: {str(e)}"
 
+# ── RESPONSE CACHES ─────────────────────────────────────────────────────────────
+# Stale-while-revalidate caches; entries carry an "updated" unix timestamp and
+# are checkpointed to STATE_FILE together with PRICE_SNAPSHOT. Only registry
+# symbols (and CACHED_CHART_PERIODS for charts) are cached, which bounds
+# their size.
+# "symbol:period" -> {"times": [unix ts, ...], "values": [...], "updated": ts,
+#                    "tz": IANA name of the exchange timezone (stocks only)}
+HISTORY_CACHE  = {}
+# symbol -> {"text": str, "updated": ts}
+NEWS_CACHE     = {}
+# "symbol:period" -> {"file_id": str, "updated": ts of the history it was drawn from}
+CHART_FILE_IDS = {}
+
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+def is_registry_symbol(symbol: str) -> bool:
+    return symbol.lower() in CRYPTO_ASSETS or symbol.upper() in STOCK_ASSETS
+
+def is_cacheable_chart(key: str) -> bool:
+    symbol, _, period = key.partition(":")
+    return is_registry_symbol(symbol) and period in CACHED_CHART_PERIODS
+
+def fetch_entry(fetch):
+    """Fetch an entry without caching it."""
+    entry = fetch()
+    if entry is not None:
+        entry["updated"] = time.time()
+    return entry
+
+def _refresh_entry(cache: dict, key: str, fetch):
+    entry = fetch_entry(fetch)
+    if entry is not None:
+        cache[key] = entry
+    return entry
+
+def _revalidate_entry(cache: dict, key: str, fetch):
+    """Refresh a cache entry in a background thread, at most once at a time."""
+    token = (id(cache), key)
+    with _revalidating_lock:
+        if token in _revalidating:
+            return
+        _revalidating.add(token)
+
+    def run():
+        try:
+            _refresh_entry(cache, key, fetch)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(token)
+
+    threading.Thread(target=run, daemon=True).start()
+
+def cached_fetch(cache: dict, key: str, ttl: float, fetch):
+    """Return the cached entry for key, fetching it if missing.
+
+    Stale entries are returned immediately and refreshed in the background.
+    fetch() returns a new entry dict, or None if the upstream call failed.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return _refresh_entry(cache, key, fetch)
+    if time.time() - entry["updated"] >= ttl:
+        _revalidate_entry(cache, key, fetch)
+    return entry
+
 # ── NEWS FUNCTIONS ──────────────────────────────────────────────────────────────
 def get_news(symbol: str) -> str:
+    latest = {}
+
+    def fetch():
+        latest["text"] = fetch_news(symbol)
+        # Don't cache errors
+        return None if latest["text"].startswith("⚠️") else {"text": latest["text"]}
+
+    if is_registry_symbol(symbol):
+        entry = cached_fetch(NEWS_CACHE, symbol.lower(), NEWS_TTL, fetch)
+    else:
+        entry = fetch_entry(fetch)
+    return entry["text"] if entry else latest["text"]
+
+def fetch_news(symbol: str) -> str:
     if not NEWS_API_KEY:
         return "⚠️ NEWS_API_KEY not set in environment."
     try:
@@ -238,9 +372,7 @@ def get_news(symbol: str) -> str:
         return f"⚠️ Error fetching news for {symbol.upper()}."
 
 # ── CHART GENERATORS ────────────────────────────────────────────────────────────
-def plot_crypto_history(symbol: str, days: int) -> str:
-    if plt is None:
-        return None
+def fetch_crypto_history(symbol: str, days: int) -> dict:
     try:
         url = f"https://api.coingecko.com/api/v3/coins/{symbol}/market_chart"
         params = {"vs_currency": "usd", "days": days}
@@ -248,34 +380,50 @@ def plot_crypto_history(symbol: str, days: int) -> str:
         prices = resp.get("prices", [])
         if not prices:
             return None
-        times = [datetime.fromtimestamp(p[0] / 1000) for p in prices]
-        vals  = [p[1] for p in prices]
-        plt.figure(figsize=(6, 3))
-        plt.plot(times, vals, linewidth=1.5)
-        plt.title(f"{symbol.replace('-', ' ').title()} price (last {days}d)")
-        plt.xlabel("Date")
-        plt.ylabel("Price (USD)")
-        plt.tight_layout()
-        tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        plt.savefig(tmp_file.name)
-        plt.close()
-        return tmp_file.name
+        return {
+            "times":  [p[0] / 1000 for p in prices],
+            "values": [p[1] for p in prices],
+        }
     except Exception:
         traceback.print_exc()
         return None
 
-def plot_stock_history(ticker: str, period: str) -> str:
-    if plt is None:
-        return None
+def fetch_stock_history(ticker: str, period: str) -> dict:
     try:
         hist = yf.Ticker(ticker.upper()).history(period=period, interval="1h")
         if hist.empty:
             return None
-        times = hist.index.to_pydatetime()
-        vals  = hist["Close"].tolist()
+        return {
+            "times":  [t.timestamp() for t in hist.index.to_pydatetime()],
+            "values": hist["Close"].tolist(),
+            # Keep the exchange timezone so the x-axis isn't shown in server time
+            "tz":     str(hist.index.tz) if hist.index.tz is not None else None,
+        }
+    except Exception:
+        traceback.print_exc()
+        return None
+
+def get_history(key: str, fetch) -> dict:
+    if is_cacheable_chart(key):
+        return cached_fetch(HISTORY_CACHE, key, HISTORY_TTL, fetch)
+    return fetch_entry(fetch)
+
+def get_crypto_history(symbol: str, days: int) -> dict:
+    return get_history(f"{symbol}:{days}d", lambda: fetch_crypto_history(symbol, days))
+
+def get_stock_history(ticker: str, period: str) -> dict:
+    return get_history(f"{ticker.upper()}:{period}", lambda: fetch_stock_history(ticker, period))
+
+def plot_history(history: dict, title: str) -> str:
+    if plt is None:
+        return None
+    try:
+        tz = ZoneInfo(history["tz"]) if history.get("tz") else None
+        times = [datetime.fromtimestamp(t, tz) for t in history["times"]]
+        vals  = history["values"]
         plt.figure(figsize=(6, 3))
         plt.plot(times, vals, linewidth=1.5)
-        plt.title(f"{ticker.upper()} price (last {period})")
+        plt.title(title)
         plt.xlabel("Date")
         plt.ylabel("Price (USD)")
         plt.tight_layout()
@@ -287,6 +435,179 @@ def plot_stock_history(ticker: str, period: str) -> str:
         traceback.print_exc()
         return None
 
+async def answer_chart(message: types.Message, key: str, history: dict, title: str, caption: str) -> bool:
+    """Send a chart, reusing Telegram's file_id if this exact data was sent before."""
+    if history is None:
+        return False
+    cached = CHART_FILE_IDS.get(key)
+    if cached and cached["updated"] == history["updated"]:
+        try:
+            await message.answer_photo(cached["file_id"], caption=caption)
+            return True
+        except Exception:
+            traceback.print_exc()
+            CHART_FILE_IDS.pop(key, None)
+    path = plot_history(history, title)
+    if not path:
+        return False
+    with open(path, 'rb') as photo:
+        sent = await message.answer_photo(photo, caption=caption)
+    if is_cacheable_chart(key):
+        CHART_FILE_IDS[key] = {"file_id": sent.photo[-1].file_id, "updated": history["updated"]}
+    return True
+
+async def send_chart(message: types.Message, symbol: str, period: str):
+    """Validate symbol/period and reply to message with the matching chart."""
+    if symbol in CRYPTO_IDS:
+        if period.endswith("d") and period[:-1].isdigit():
+            days = int(period[:-1])
+            name = symbol.replace('-', ' ').title()
+            sent = await answer_chart(
+                message,
+                f"{symbol}:{days}d",
+                get_crypto_history(symbol, days),
+                title=f"{name} price (last {days}d)",
+                caption=f"📈 {name} - Last {days} days"
+            )
+            if not sent:
+                await message.answer(f"⚠️ Could not fetch historical data for {symbol}.")
+        else:
+            await message.answer("For crypto, period must be in days (e.g. `7d`, `30d`).")
+    elif symbol.upper() in STOCK_TICKERS:
+        yf_period = period
+        if period.endswith("d") and period[:-1].isdigit():
+            yf_period = period
+        elif period not in ["1d", "5d", "1mo", "3mo", "6mo", "1y"]:
+            await message.answer("Invalid period for stock. Use `1d`, `5d`, `1mo`, etc.")
+            return
+        sent = await answer_chart(
+            message,
+            f"{symbol.upper()}:{yf_period}",
+            get_stock_history(symbol.upper(), yf_period),
+            title=f"{symbol.upper()} price (last {yf_period})",
+            caption=f"📈 {symbol.upper()} - Last {yf_period}"
+        )
+        if not sent:
+            await message.answer(f"⚠️ Could not fetch historical data for {symbol.upper()}.")
+    else:
+        await message.answer("⚠️ Symbol not recognized. Use a valid crypto ID or stock ticker.")
+
+# ── PRICE SNAPSHOT ──────────────────────────────────────────────────────────────
+# Latest known price per symbol, refreshed in the background so that
+# latency-sensitive handlers (inline mode) never have to call upstream.
+# symbol -> {"price": float, "updated": unix timestamp}
+PRICE_SNAPSHOT = {}
+
+def fetch_crypto_snapshot() -> dict:
+    snapshot = {}
+    url = "https://api.coingecko.com/api/v3/simple/price"
+    # Keep the ids parameter to a sane URL length
+    for start in range(0, len(CRYPTO_IDS), 250):
+        chunk = CRYPTO_IDS[start:start + 250]
+        try:
+            response = requests.get(url, params={"ids": ",".join(chunk), "vs_currencies": "usd"}, timeout=15)
+            if response.status_code != 200:
+                print(f"⚠️ Snapshot: CoinGecko API error ({response.status_code})")
+                continue
+            data = response.json()
+            now = time.time()
+            for cid in chunk:
+                price = (data.get(cid) or {}).get("usd")
+                if price is not None and price > 0:
+                    snapshot[cid] = {"price": price, "updated": now}
+        except Exception:
+            traceback.print_exc()
+    return snapshot
+
+def fetch_stock_snapshot() -> dict:
+    snapshot = {}
+    # One yf.download call per batch instead of one .info request per ticker
+    for start in range(0, len(STOCK_TICKERS), STOCK_BATCH_SIZE):
+        chunk = STOCK_TICKERS[start:start + STOCK_BATCH_SIZE]
+        try:
+            data = yf.download(chunk, period="5d", interval="1d", group_by="ticker",
+                               threads=True, progress=False)
+            now = time.time()
+            for t in chunk:
+                if t not in data.columns.get_level_values(0):
+                    continue
+                closes = data[t]["Close"].dropna()
+                if closes.empty:
+                    continue
+                # The last daily bar tracks the live price during market hours
+                price = float(closes.iloc[-1])
+                if price > 0:
+                    snapshot[t] = {"price": price, "updated": now}
+        except Exception:
+            traceback.print_exc()
+    return snapshot
+
+async def refresh_price_snapshot():
+    """Refresh PRICE_SNAPSHOT forever; blocking fetches run in a worker thread."""
+    loop = asyncio.get_event_loop()
+    while True:
+        try:
+            crypto = await loop.run_in_executor(None, fetch_crypto_snapshot)
+            stocks = await loop.run_in_executor(None, fetch_stock_snapshot)
+            # Keep the last good value for symbols that failed this round
+            PRICE_SNAPSHOT.update(crypto)
+            PRICE_SNAPSHOT.update(stocks)
+        except Exception:
+            traceback.print_exc()
+        await asyncio.sleep(SNAPSHOT_REFRESH_SECONDS)
+
+# ── INLINE SEARCH INDEX ─────────────────────────────────────────────────────────
+def build_prefix_index() -> dict:
+    """Map every prefix of every search key (id, name words, ticker) to symbols.
+
+    Symbols are stored in registry order so results come out stable.
+    """
+    keys = []
+    for cid, (name, ticker) in CRYPTO_ASSETS.items():
+        keys.append((cid, [cid, ticker, name, *name.split()]))
+    for ticker, name in STOCK_ASSETS.items():
+        keys.append((ticker, [ticker, name, *name.split()]))
+
+    index = {}
+    for symbol, words in keys:
+        for word in words:
+            word = word.lower()
+            for end in range(1, len(word) + 1):
+                matches = index.setdefault(word[:end], [])
+                if symbol not in matches:
+                    matches.append(symbol)
+    return index
+
+PREFIX_INDEX = build_prefix_index()
+ALL_SYMBOLS  = CRYPTO_IDS + STOCK_TICKERS
+
+def search_symbols(query: str) -> list:
+    query = query.strip().lower()
+    if not query:
+        return ALL_SYMBOLS[:INLINE_MAX_RESULTS]
+    return PREFIX_INDEX.get(query, [])[:INLINE_MAX_RESULTS]
+
+def is_fresh_price(symbol: str) -> bool:
+    """True if the snapshot holds a price for `symbol` younger than PRICE_MAX_AGE."""
+    entry = PRICE_SNAPSHOT.get(symbol)
+    return bool(entry) and time.time() - entry["updated"] <= PRICE_MAX_AGE
+
+def format_price_card(symbol: str, dated: bool = False) -> str:
+    """Snapshot price in the same format as get_*_price_single, or None if unknown.
+
+    With `dated`, the snapshot time is appended so stale fallbacks are marked.
+    """
+    entry = PRICE_SNAPSHOT.get(symbol)
+    if not entry:
+        return None
+    if symbol in CRYPTO_ASSETS:
+        card = f"{symbol.replace('-', ' ').title()}: {format_price(entry['price'])}"
+    else:
+        card = f"{symbol.upper()}: ${entry['price']:,.2f}"
+    if dated:
+        card += f" (as of {datetime.utcfromtimestamp(entry['updated']):%d %b %H:%M} UTC)"
+    return card
+
 # ── TELEGRAM API ────────────────────────────────────────────────────────────────
 def get_updates(offset=None, timeout=30):
     resp = requests.get(f"{BASE_URL}/getUpdates", params={"offset": offset, "timeout": timeout})
@@ -350,7 +671,8 @@ async def start_command(message: types.Message):
         "Use `/stocks` to get all stock prices.\n"
         "Use `/chart <symbol> <period>` for a price chart:\n"
         "   `/chart bitcoin 7d` or `/chart AAPL 1d`.\n"
-        "Use `/news <symbol>` for latest headlines.\n\n"
+        "Use `/news <symbol>` for latest headlines.\n"
+        "Type `@<bot username> <symbol>` in any chat for an instant quote.\n\n"
         "🌐 Or click the button below to open the web interface:",
         parse_mode="Markdown",
         reply_markup=keyboard
@@ -407,38 +729,7 @@ async def chart_callback(callback_query: types.CallbackQuery):
             symbol = parts[0].lower()
             period = parts[1].lower()
             
-            if symbol in CRYPTO_IDS:
-                if period.endswith("d") and period[:-1].isdigit():
-                    days = int(period[:-1])
-                    path = plot_crypto_history(symbol, days)
-                    if path:
-                        with open(path, 'rb') as photo:
-                            await callback_query.message.answer_photo(
-                                photo,
-                                caption=f"📈 {symbol.replace('-', ' ').title()} - Last {days} days"
-                            )
-                    else:
-                        await callback_query.message.answer(f"⚠️ Could not fetch historical data for {symbol}.")
-                else:
-                    await callback_query.message.answer("For crypto, period must be in days (e.g. `7d`, `30d`).")
-            elif symbol.upper() in STOCK_TICKERS:
-                yf_period = period
-                if period.endswith("d") and period[:-1].isdigit():
-                    yf_period = period
-                elif period not in ["1d", "5d", "1mo", "3mo", "6mo", "1y"]:
-                    await callback_query.message.answer("Invalid period for stock. Use `1d`, `5d`, `1mo`, etc.")
-                    return
-                path = plot_stock_history(symbol.upper(), yf_period)
-                if path:
-                    with open(path, 'rb') as photo:
-                        await callback_query.message.answer_photo(
-                            photo,
-                            caption=f"📈 {symbol.upper()} - Last {yf_period}"
-                        )
-                else:
-                    await callback_query.message.answer(f"⚠️ Could not fetch historical data for {symbol.upper()}.")
-            else:
-                await callback_query.message.answer("⚠️ Symbol not recognized. Use a valid crypto ID or stock ticker.")
+            await send_chart(callback_query.message, symbol, period)
         else:
             await callback_query.message.answer("Invalid chart format. Expected: chart_symbol_period")
     except Exception as e:
@@ -477,38 +768,7 @@ async def handle_webapp_data(message: types.Message):
                 symbol = parts[0].lower()
                 period = parts[1].lower()
                 
-                if symbol in CRYPTO_IDS:
-                    if period.endswith("d") and period[:-1].isdigit():
-                        days = int(period[:-1])
-                        path = plot_crypto_history(symbol, days)
-                        if path:
-                            with open(path, 'rb') as photo:
-                                await message.answer_photo(
-                                    photo,
-                                    caption=f"📈 {symbol.replace('-', ' ').title()} - Last {days} days"
-                                )
-                        else:
-                            await message.answer(f"⚠️ Could not fetch historical data for {symbol}.")
-                    else:
-                        await message.answer("For crypto, period must be in days (e.g. `7d`, `30d`).")
-                elif symbol.upper() in STOCK_TICKERS:
-                    yf_period = period
-                    if period.endswith("d") and period[:-1].isdigit():
-                        yf_period = period
-                    elif period not in ["1d", "5d", "1mo", "3mo", "6mo", "1y"]:
-                        await message.answer("Invalid period for stock. Use `1d`, `5d`, `1mo`, etc.")
-                        return
-                    path = plot_stock_history(symbol.upper(), yf_period)
-                    if path:
-                        with open(path, 'rb') as photo:
-                            await message.answer_photo(
-                                photo,
-                                caption=f"📈 {symbol.upper()} - Last {yf_period}"
-                            )
-                    else:
-                        await message.answer(f"⚠️ Could not fetch historical data for {symbol.upper()}.")
-                else:
-                    await message.answer("⚠️ Symbol not recognized. Use a valid crypto ID or stock ticker.")
+                await send_chart(message, symbol, period)
             else:
                 await message.answer("Invalid chart format. Expected: chart:symbol period")
         elif data.startswith("news:"):
@@ -555,38 +815,7 @@ async def chart_command(message: types.Message):
     symbol = parts[1].lower()
     period = parts[2].lower()
 
-    if symbol in CRYPTO_IDS:
-        if period.endswith("d") and period[:-1].isdigit():
-            days = int(period[:-1])
-            path = plot_crypto_history(symbol, days)
-            if path:
-                with open(path, 'rb') as photo:
-                    await message.answer_photo(
-                        photo,
-                        caption=f"📈 {symbol.replace('-', ' ').title()} - Last {days} days"
-                    )
-            else:
-                await message.answer(f"⚠️ Could not fetch historical data for {symbol}.")
-        else:
-            await message.answer("For crypto, period must be in days (e.g. `7d`, `30d`).")
-    elif symbol.upper() in STOCK_TICKERS:
-        yf_period = period
-        if period.endswith("d") and period[:-1].isdigit():
-            yf_period = period
-        elif period not in ["1d", "5d", "1mo", "3mo", "6mo", "1y"]:
-            await message.answer("Invalid period for stock. Use `1d`, `5d`, `1mo`, etc.")
-            return
-        path = plot_stock_history(symbol.upper(), yf_period)
-        if path:
-            with open(path, 'rb') as photo:
-                await message.answer_photo(
-                    photo,
-                    caption=f"📈 {symbol.upper()} - Last {yf_period}"
-                )
-        else:
-            await message.answer(f"⚠️ Could not fetch historical data for {symbol.upper()}.")
-    else:
-        await message.answer("⚠️ Symbol not recognized. Use a valid crypto ID or stock ticker.")
+    await send_chart(message, symbol, period)
 
 @dp.message_handler(commands=["news", "headlines", "latest_news", "news_articles"])
 async def news_command(message: types.Message):
@@ -602,11 +831,129 @@ async def news_command(message: types.Message):
     symbol = parts[1].lower()
     await message.answer(get_news(symbol), parse_mode="Markdown")
 
+# ── INLINE MODE ─────────────────────────────────────────────────────────────────
+# user id -> id of that user's most recent inline query
+_latest_inline_query = {}
+
+@dp.inline_handler()
+async def inline_price_query(inline_query: types.InlineQuery):
+    """Answer `@bot <symbol>` from the in-memory snapshot; never calls upstream."""
+    user_id = inline_query.from_user.id
+    _latest_inline_query[user_id] = inline_query.id
+
+    # Telegram sends one query per keystroke; only answer the last one
+    await asyncio.sleep(INLINE_DEBOUNCE_SECONDS)
+    if _latest_inline_query.get(user_id) != inline_query.id:
+        return
+    del _latest_inline_query[user_id]
+
+    try:
+        results = []
+        for symbol in search_symbols(inline_query.query):
+            card = format_price_card(symbol)
+            if card is None:
+                continue
+            if symbol in CRYPTO_ASSETS:
+                name, ticker = CRYPTO_ASSETS[symbol]
+            else:
+                name, ticker = STOCK_ASSETS[symbol], symbol
+            updated = datetime.utcfromtimestamp(PRICE_SNAPSHOT[symbol]["updated"])
+            # Show the date too when the price is not from today
+            as_of = f"{updated:%H:%M}" if updated.date() == datetime.utcnow().date() else f"{updated:%d %b %H:%M}"
+            results.append(types.InlineQueryResultArticle(
+                id=symbol,
+                title=f"{name} ({ticker})",
+                description=f"{card.split(': ', 1)[1]} · as of {as_of} UTC",
+                input_message_content=types.InputTextMessageContent(card),
+            ))
+        await inline_query.answer(results, cache_time=INLINE_CACHE_TIME, is_personal=False)
+    except Exception:
+        traceback.print_exc()
+
+# ── PERSISTENT STATE ────────────────────────────────────────────────────────────
+# Set by on_startup; checkpoints are skipped when STATE_FILE can't be written
+_state_dir_usable = False
+
+def check_state_dir() -> bool:
+    """Make sure STATE_FILE's directory exists and is writable.
+
+    Warns if it won't survive a deploy; returns False if checkpoints can't be written.
+    """
+    state_dir = os.path.dirname(os.path.abspath(STATE_FILE))
+    try:
+        os.makedirs(state_dir, exist_ok=True)
+    except OSError as e:
+        print(f"⚠️ Cannot create state directory {state_dir}: {e}; checkpoints disabled")
+        return False
+    if not os.access(state_dir, os.W_OK | os.X_OK):
+        print(f"⚠️ State directory {state_dir} is not writable; checkpoints disabled")
+        return False
+    volume = os.getenv("RAILWAY_VOLUME_MOUNT_PATH")
+    is_volume = volume and os.path.abspath(volume) == state_dir
+    if not is_volume and not os.path.ismount(state_dir):
+        print(f"⚠️ State directory {state_dir} is not a mounted volume; "
+              f"cached state will be lost on redeploy")
+    return True
+
+def restore_state():
+    """Load the last checkpoint so a fresh process starts with warm caches.
+
+    Restored entries keep their original timestamps, so anything past its
+    TTL is served once and revalidated in the background.
+    """
+    started = time.perf_counter()
+    state = load_state(STATE_FILE)
+    if not state:
+        print(f"🟡 No usable state in {STATE_FILE}; starting cold")
+        return
+    # Skip entries for symbols/periods that are no longer cached
+    PRICE_SNAPSHOT.update({k: v for k, v in state["prices"].items() if is_registry_symbol(k)})
+    HISTORY_CACHE.update({k: v for k, v in state["history"].items() if is_cacheable_chart(k)})
+    NEWS_CACHE.update({k: v for k, v in state["news"].items() if is_registry_symbol(k)})
+    CHART_FILE_IDS.update({k: v for k, v in state["chart_file_ids"].items() if is_cacheable_chart(k)})
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"🟢 Restored {len(PRICE_SNAPSHOT)} prices, {len(HISTORY_CACHE)} charts, "
+          f"{len(NEWS_CACHE)} news results from {STATE_FILE} in {elapsed_ms:.1f}ms")
+
+def checkpoint_state():
+    try:
+        # dict() copies so background refreshes can't mutate mid-write
+        save_state(
+            STATE_FILE,
+            dict(PRICE_SNAPSHOT),
+            dict(HISTORY_CACHE),
+            dict(NEWS_CACHE),
+            dict(CHART_FILE_IDS),
+        )
+    except Exception:
+        traceback.print_exc()
+
+async def checkpoint_loop():
+    """Write the caches to STATE_FILE every CHECKPOINT_SECONDS."""
+    loop = asyncio.get_event_loop()
+    while True:
+        await asyncio.sleep(CHECKPOINT_SECONDS)
+        await loop.run_in_executor(None, checkpoint_state)
+
 # ── MAIN FUNCTION ────────────────────────────────────────────────────────────────
 async def main():
     """Start the bot."""
     print("🟢 Bot started with aiogram...")
     await dp.start_polling()
 
+async def on_startup(dispatcher: Dispatcher):
+    """Start background tasks once the event loop is running."""
+    global _state_dir_usable
+    _state_dir_usable = check_state_dir()
+    restore_state()
+    asyncio.create_task(refresh_price_snapshot())
+    if _state_dir_usable:
+        asyncio.create_task(checkpoint_loop())
+
+async def on_shutdown(dispatcher: Dispatcher):
+    """Write a final checkpoint so the next process starts warm."""
+    if _state_dir_usable:
+        checkpoint_state()
+
 if __name__ == "__main__":
-    executor.start_polling(dp, skip_updates=True)
+    executor.start_polling(dp, skip_updates=True, on_startup=on_startup, on_shutdown=on_shutdown)
@@ -0,0 +1,144 @@
+# state.py
+
+# Compact on-disk checkpoint of the bot's hot caches so a restarted process
+# can answer from warm data straight away instead of stampeding upstream APIs.
+#
+# File layout (little-endian):
+#   header   magic "CSST", version u16, reserved u16,
+#            meta length u32, data length u32, crc32 of meta+data u32
+#   meta     zlib-compressed JSON: prices, news, chart file_ids and, for each
+#            history series, its timestamp, timezone and offset/length into `data`
+#   data     raw float64 arrays (history times followed by values)
+#
+# History arrays dominate the file size, so they are stored as raw doubles
+# rather than JSON text and are read back straight from the memory map.
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import tempfile
+import traceback
+from array import array
+
+MAGIC   = b"CSST"
+VERSION = 1
+HEADER  = struct.Struct("<4sHHIII")
+
+# Doubles are stored little-endian regardless of the host
+_SWAP = sys.byteorder != "little"
+
+def save_state(path: str, prices: dict, history: dict, news: dict, chart_file_ids: dict):
+    """Atomically write the caches to `path`.
+
+    history maps key -> {"times": [...], "values": [...], "updated": ts,
+    "tz": name or None};
+    the other caches are JSON-serialisable dicts. Raises ValueError if a
+    series' times and values differ in length.
+    """
+    data = array("d")
+    series = {}
+    for key, entry in history.items():
+        count = len(entry["values"])
+        if len(entry["times"]) != count:
+            raise ValueError(f"history {key!r} has {len(entry['times'])} times but {count} values")
+        series[key] = {
+            "updated": entry["updated"],
+            "tz":      entry.get("tz"),
+            "offset":  len(data),
+            "count":   count,
+        }
+        data.extend(entry["times"])
+        data.extend(entry["values"])
+    if data.itemsize != 8:
+        raise RuntimeError("float64 arrays are required for the state file")
+    if _SWAP:
+        data.byteswap()
+
+    meta = zlib.compress(json.dumps({
+        "prices":         prices,
+        "history":        series,
+        "news":           news,
+        "chart_file_ids": chart_file_ids,
+    }, separators=(",", ":")).encode("utf-8"))
+    blob = data.tobytes()
+    header = HEADER.pack(MAGIC, VERSION, 0, len(meta), len(blob), zlib.crc32(meta + blob))
+
+    # Write to a temp file in the same directory, then rename over the old
+    # checkpoint so a crash mid-write never leaves a torn file behind.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".state-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(meta)
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _read_history(blob: memoryview, series: dict) -> dict:
+    doubles = blob.cast("d")
+    try:
+        history = {}
+        for key, entry in series.items():
+            start, count = entry["offset"], entry["count"]
+            times = array("d", doubles[start:start + count])
+            values = array("d", doubles[start + count:start + 2 * count])
+            if _SWAP:
+                times.byteswap()
+                values.byteswap()
+            history[key] = {
+                "times":   times.tolist(),
+                "values":  values.tolist(),
+                "updated": entry["updated"],
+                "tz":      entry.get("tz"),
+            }
+        return history
+    finally:
+        doubles.release()
+        blob.release()
+
+def load_state(path: str) -> dict:
+    """Read a checkpoint written by save_state; return {} if missing or invalid."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, _, meta_len, data_len, crc = HEADER.unpack_from(mm, 0)
+                if magic != MAGIC or version != VERSION:
+                    print(f"⚠️ Ignoring state file {path}: unknown format")
+                    return {}
+                if len(mm) != HEADER.size + meta_len + data_len:
+                    print(f"⚠️ Ignoring state file {path}: truncated")
+                    return {}
+                body = memoryview(mm)[HEADER.size:]
+                try:
+                    if zlib.crc32(body) != crc:
+                        print(f"⚠️ Ignoring state file {path}: checksum mismatch")
+                        return {}
+                    meta = json.loads(zlib.decompress(body[:meta_len]).decode("utf-8"))
+                    history = _read_history(body[meta_len:], meta.get("history", {}))
+                finally:
+                    body.release()
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError, zlib.error):
+        traceback.print_exc()
+        return {}
+
+    return {
+        "prices":         meta.get("prices", {}),
+        "history":        history,
+        "news":           meta.get("news", {}),
+        "chart_file_ids": meta.get("chart_file_ids", {}),
+    }
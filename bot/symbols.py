@@ -0,0 +1,47 @@
+# symbols.py
+
+# Symbol registry shared by the bot and the static page generator
+# (generate_pages.py). Adding an asset here is all that is needed for the
+# bot to accept it and for its web page and list entry to be rendered.
+
+# ── CRYPTO ─────────────────────────────────────────────────────────────────────
+# CoinGecko ID -> (display name, ticker)
+CRYPTO_ASSETS = {
+    "bitcoin":          ("Bitcoin", "BTC"),
+    "ethereum":         ("Ethereum", "ETH"),
+    "ripple":           ("Ripple", "XRP"),
+    "hedera-hashgraph": ("Hedera Hashgraph", "HBAR"),
+    "stellar":          ("Stellar", "XLM"),
+    "quant-network":    ("Quant Network", "QNT"),
+    "ondo":             ("Ondo", "ONDO"),
+    "xdc-network":      ("XDC Network", "XDC"),
+    "pepe":             ("Pepe", "PEPE"),
+    "shiba-inu":        ("Shiba Inu", "SHIB"),
+    "solana":           ("Solana", "SOL"),
+    "dogecoin":         ("Dogecoin", "DOGE"),
+}
+
+# ── STOCKS ─────────────────────────────────────────────────────────────────────
+# Ticker -> display name
+STOCK_ASSETS = {
+    "AAPL":  "Apple",
+    "MSFT":  "Microsoft",
+    "NVDA":  "NVIDIA",
+    "AMZN":  "Amazon",
+    "GOOGL": "Alphabet Inc.",
+}
+
+# ── ICONS ──────────────────────────────────────────────────────────────────────
+# Symbol -> icon shown on the web list pages; assets without one show their ticker
+ASSET_ICONS = {
+    "bitcoin":  "₿",
+    "ethereum": "Ξ",
+    "AAPL":     "🍎",
+    "MSFT":     "🪟",
+    "NVDA":     "🎮",
+    "AMZN":     "📦",
+    "GOOGL":    "🔍",
+}
+
+CRYPTO_IDS    = list(CRYPTO_ASSETS)
+STOCK_TICKERS = list(STOCK_ASSETS)
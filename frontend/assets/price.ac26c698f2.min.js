@@ -0,0 +1,63 @@
+async function fetchCryptoPrice(symbol) {
+const coinId = symbol;
+const response = await fetch(`https://api.coingecko.com/api/v3/simple/price?ids=${coinId}&vs_currencies=usd`);
+const data = await response.json();
+if (data[coinId] && data[coinId].usd) {
+const price = data[coinId].usd;
+return formatPrice(price);
+}
+throw new Error('Price not available');
+}
+async function fetchStockPrice(symbol) {
+const response = await fetch(`https://query1.finance.yahoo.com/v8/finance/chart/${symbol.toUpperCase()}`);
+const data = await response.json();
+if (data.chart && data.chart.result && data.chart.result[0]) {
+const result = data.chart.result[0];
+const price = result.meta.regularMarketPrice;
+return formatPrice(price);
+}
+throw new Error('Price not available');
+}
+function formatPrice(price) {
+if (price >= 1) {
+return `$${price.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`;
+}
+return `$${price.toFixed(8).replace(/\.?0+$/, '')}`;
+}
+async function loadCurrentPrice() {
+const priceElement = document.getElementById('current-price');
+if (!priceElement) return;
+try {
+if (!priceElement.querySelector('.price-value')) {
+priceElement.innerHTML = '<span class="loading">Loading price...</span>';
+}
+const symbol = document.body.getAttribute('data-symbol');
+const type = document.body.getAttribute('data-type');
+if (!symbol || !type) {
+throw new Error('Missing symbol or type data');
+}
+let price = '';
+if (type === 'crypto') {
+price = await fetchCryptoPrice(symbol);
+} else {
+price = await fetchStockPrice(symbol);
+}
+priceElement.innerHTML = `<span class="price-value">${price}</span>`;
+} catch (error) {
+console.error('Error loading price:', error);
+if (!priceElement.querySelector('.price-value')) {
+priceElement.innerHTML = '<span class="error">Price unavailable</span>';
+}
+}
+}
+function startPriceRefresh() {
+setInterval(loadCurrentPrice, 30000);
+}
+document.addEventListener('DOMContentLoaded', function() {
+const symbol = document.body.getAttribute('data-symbol');
+const type = document.body.getAttribute('data-type');
+if (symbol && type) {
+loadCurrentPrice();
+startPriceRefresh();
+}
+});
@@ -0,0 +1,77 @@
+const BOT_USERNAME = 'gbcn_bot';
+function sendTelegramCommand(command, newTab = true) {
+if (!command || typeof command !== 'string') {
+console.error('Invalid command provided to sendTelegramCommand:', command);
+return;
+}
+const cleanCommand = command.startsWith('/') ? command : `/${command}`;
+const encodedCommand = encodeURIComponent(cleanCommand);
+const telegramUrl = `https://t.me/${BOT_USERNAME}?start=${encodedCommand}`;
+try {
+if (newTab) {
+window.open(telegramUrl, '_blank', 'noopener,noreferrer');
+} else {
+window.location.href = telegramUrl;
+}
+console.log(`Telegram command sent: ${cleanCommand}`);
+} catch (error) {
+console.error('Error opening Telegram:', error);
+try {
+window.location.href = telegramUrl;
+} catch (fallbackError) {
+console.error('Fallback also failed:', fallbackError);
+}
+}
+}
+function getCryptoPrices() {
+sendTelegramCommand('/crypto');
+}
+function getStockPrices() {
+sendTelegramCommand('/stocks');
+}
+function getCryptoChart(crypto, period = '7d') {
+sendTelegramCommand(`/chart ${crypto} ${period}`);
+}
+function getNews(symbol) {
+sendTelegramCommand(`/news ${symbol}`);
+}
+if (typeof module !== 'undefined' && module.exports) {
+module.exports = {
+sendTelegramCommand,
+getCryptoPrices,
+getStockPrices,
+getCryptoChart,
+getNews
+};
+}
+if (typeof Telegram !== 'undefined' && Telegram.WebApp) {
+Telegram.WebApp.ready();
+document.addEventListener('DOMContentLoaded', function() {
+const cryptoBtn = document.getElementById("cryptoBtn");
+if (cryptoBtn) {
+cryptoBtn.addEventListener("click", () => {
+Telegram.WebApp.sendData("crypto");
+});
+}
+const stockBtn = document.getElementById("stockBtn");
+if (stockBtn) {
+stockBtn.addEventListener("click", () => {
+Telegram.WebApp.sendData("stocks");
+});
+}
+const chartButtons = document.querySelectorAll("[data-chart]");
+chartButtons.forEach(button => {
+button.addEventListener("click", () => {
+const chartData = button.getAttribute("data-chart");
+Telegram.WebApp.sendData(`chart:${chartData}`);
+});
+});
+const newsButtons = document.querySelectorAll("[data-news]");
+newsButtons.forEach(button => {
+button.addEventListener("click", () => {
+const newsData = button.getAttribute("data-news");
+Telegram.WebApp.sendData(`news:${newsData}`);
+});
+});
+});
+}
@@ -3,32 +3,12 @@
  * Loads current prices for crypto and stocks
  */
 
-/**
- * Map common coin names to CoinGecko IDs
- */
-function getCoinGeckoId(symbol) {
-    const coinMap = {
-        'bitcoin': 'bitcoin',
-        'ethereum': 'ethereum',
-        'ripple': 'ripple',
-        'hedera-hashgraph': 'hedera-hashgraph',
-        'stellar': 'stellar',
-        'quant-network': 'quant-network',
-        'ondo': 'ondo',
-        'xdc-network': 'xdc-network',
-        'pepe': 'pepe',
-        'shiba-inu': 'shiba-inu',
-        'solana': 'solana',
-        'dogecoin': 'dogecoin'
-    };
-    return coinMap[symbol] || symbol;
-}
-
 /**
  * Fetch crypto price from CoinGecko API
  */
 async function fetchCryptoPrice(symbol) {
-    const coinId = getCoinGeckoId(symbol);
+    // Pages are keyed by CoinGecko ID (see bot/symbols.py)
+    const coinId = symbol;
     const response = await fetch(`https://api.coingecko.com/api/v3/simple/price?ids=${coinId}&vs_currencies=usd`);
     const data = await response.json();
     
@@ -72,7 +52,10 @@ async function loadCurrentPrice() {
     if (!priceElement) return;
     
     try {
-        priceElement.innerHTML = '<span class="loading">Loading price...</span>';
+        // Keep the pre-baked snapshot price on screen while refreshing
+        if (!priceElement.querySelector('.price-value')) {
+            priceElement.innerHTML = '<span class="loading">Loading price...</span>';
+        }
         
         const symbol = document.body.getAttribute('data-symbol');
         const type = document.body.getAttribute('data-type');
@@ -88,10 +71,14 @@ async function loadCurrentPrice() {
             price = await fetchStockPrice(symbol);
         }
         
+        // Also drops the "as of" note of the baked snapshot
         priceElement.innerHTML = `<span class="price-value">${price}</span>`;
     } catch (error) {
         console.error('Error loading price:', error);
-        priceElement.innerHTML = '<span class="error">Price unavailable</span>';
+        // A dated snapshot price beats no price at all
+        if (!priceElement.querySelector('.price-value')) {
+            priceElement.innerHTML = '<span class="error">Price unavailable</span>';
+        }
     }
 }
 
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Render the asset pages of the frontend from the bot's symbol registry.
+
+The per-asset pages in frontend/coins and frontend/stocks are rendered from
+frontend/templates/asset.html, and the crypto.html/stocks.html list pages
+from their templates in the same folder, all driven by bot/symbols.py (the
+landing page index.html is rendered too, so it links the hashed stylesheet). Adding
+an asset there is enough to get its page and its list entry. Each asset page
+embeds a pre-baked price and sparkline snapshot (with the time it was taken)
+so the first paint does not wait on CoinGecko/Yahoo; price.js refreshes it
+afterwards.
+
+The shared script.js, price.js and style.css are minified and written to
+frontend/assets/ under content-hashed names, so browsers can cache them
+forever (see frontend/serve.json) and a change to any of them busts the
+cache automatically.
+
+Pages are only rewritten when their inputs (template, asset hashes, registry
+entry or snapshot data) changed since the last run; a price that did not move
+keeps its original timestamp, so it does not count as a change. The input
+digests and the last good snapshot are kept in frontend/.pages-manifest.json
+(or $PAGES_MANIFEST), and symbols whose fetch fails keep their previous
+snapshot. Both only help where that file survives between runs: a build from
+a fresh checkout, such as a Railway deploy, renders every page and leaves
+symbols it could not fetch in the loading state.
+
+This runs as the frontend's `npm run build` and only needs the standard
+library.
+
+Usage:
+    python generate_pages.py                     # fetch a fresh snapshot
+    python generate_pages.py --offline           # no snapshot, "Loading price..."
+    python generate_pages.py --snapshot prices.json
+    python generate_pages.py --force             # rewrite every page
+"""
+import os
+import re
+import html
+import sys
+import json
+import time
+import hashlib
+import argparse
+import traceback
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+from string import Template
+
+ROOT_DIR      = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR  = os.path.join(ROOT_DIR, "frontend")
+ASSETS_DIR    = os.path.join(FRONTEND_DIR, "assets")
+TEMPLATES_DIR = os.path.join(FRONTEND_DIR, "templates")
+MANIFEST      = os.getenv("PAGES_MANIFEST", os.path.join(FRONTEND_DIR, ".pages-manifest.json"))
+
+# Shared static files that get minified and content-hashed
+SHARED_FILES = ["script.js", "price.js", "style.css"]
+
+# Number of points kept in the embedded sparkline
+SPARKLINE_POINTS = 48
+
+# Yahoo's quote endpoint accepts many symbols per request
+STOCK_BATCH_SIZE = 100
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "bot"))
+from symbols import CRYPTO_ASSETS, STOCK_ASSETS, ASSET_ICONS  # noqa: E402
+
+
+# ── MINIFICATION ───────────────────────────────────────────────────────────────
+def minify_js(source: str) -> str:
+    """Conservative line-based JS minifier.
+
+    Only drops whole-line comments, blank lines and indentation. Lines inside
+    a multi-line template literal are copied verbatim; backticks are counted
+    per line, so a backtick inside a quoted string or comment errs towards
+    copying more lines verbatim, never fewer.
+    """
+    lines = []
+    in_template = False
+    in_comment = False
+    for line in source.splitlines():
+        if in_template:
+            lines.append(line)
+            in_template = line.count("`") % 2 == 0
+            continue
+        stripped = line.strip()
+        if in_comment:
+            if "*/" not in stripped:
+                continue
+            in_comment = False
+            stripped = stripped.split("*/", 1)[1].strip()
+        elif stripped.startswith("/*"):
+            if "*/" not in stripped:
+                in_comment = True
+                continue
+            stripped = stripped.split("*/", 1)[1].strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+        in_template = stripped.count("`") % 2 == 1
+    return "\n".join(lines) + "\n"
+
+# Quoted strings are matched first so comment/whitespace rules skip them
+_CSS_STRING  = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMMENT = re.compile(rf"({_CSS_STRING})|/\*.*?\*/", re.DOTALL)
+_CSS_STRINGS = re.compile(rf"({_CSS_STRING})")
+
+def minify_css(source: str) -> str:
+    source = _CSS_COMMENT.sub(lambda m: m.group(1) or "", source)
+    # re.split with a capture group puts the string literals at odd indexes
+    parts = _CSS_STRINGS.split(source)
+    for i in range(0, len(parts), 2):
+        parts[i] = _squeeze_css(parts[i])
+    return "".join(parts).strip() + "\n"
+
+def _squeeze_css(chunk: str) -> str:
+    chunk = re.sub(r"\s+", " ", chunk)
+    chunk = re.sub(r"\s*([{};,>])\s*", r"\1", chunk)
+    return chunk.replace(";}", "}")
+
+def build_shared_assets() -> dict:
+    """Minify and hash the shared files; return {original name: assets/hashed name}."""
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    built = {}
+    for filename in SHARED_FILES:
+        with open(os.path.join(FRONTEND_DIR, filename), "r", encoding="utf-8") as f:
+            source = f.read()
+        stem, ext = os.path.splitext(filename)
+        minified = minify_css(source) if ext == ".css" else minify_js(source)
+        digest = hashlib.sha256(minified.encode("utf-8")).hexdigest()[:10]
+        hashed_name = f"{stem}.{digest}.min{ext}"
+        path = os.path.join(ASSETS_DIR, hashed_name)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(minified)
+            print(f"Built assets/{hashed_name}")
+        built[filename] = f"assets/{hashed_name}"
+
+    # Drop hashed copies left over from previous builds
+    current = {os.path.basename(p) for p in built.values()}
+    for name in os.listdir(ASSETS_DIR):
+        if name not in current and re.match(r"^[\w-]+\.[0-9a-f]{10}\.min\.(js|css)$", name):
+            os.remove(os.path.join(ASSETS_DIR, name))
+            print(f"Removed stale assets/{name}")
+    return built
+
+
+# ── SNAPSHOT ───────────────────────────────────────────────────────────────────
+def get_json(url: str, params: dict, timeout: int):
+    request = urllib.request.Request(
+        f"{url}?{urllib.parse.urlencode(params)}",
+        headers={"User-Agent": "Mozilla/5.0"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+def fetch_crypto_snapshot(ids: list) -> dict:
+    """Latest price plus 7d sparkline for each CoinGecko ID."""
+    snapshot = {}
+    url = "https://api.coingecko.com/api/v3/coins/markets"
+    # /coins/markets returns at most 250 coins per page
+    for start in range(0, len(ids), 250):
+        chunk = ids[start:start + 250]
+        try:
+            coins = get_json(url, {
+                "vs_currency": "usd",
+                "ids":         ",".join(chunk),
+                "per_page":    len(chunk),
+                "sparkline":   "true",
+            }, timeout=15)
+            now = time.time()
+            for coin in coins:
+                price = coin.get("current_price")
+                if price is None or price <= 0:
+                    continue
+                sparkline = (coin.get("sparkline_in_7d") or {}).get("price") or []
+                snapshot[coin["id"]] = {"price": price, "sparkline": sparkline, "updated": now}
+        except urllib.error.HTTPError as e:
+            print(f"Warning: CoinGecko API error ({e.code})")
+        except Exception:
+            traceback.print_exc()
+    return snapshot
+
+def fetch_stock_snapshot(tickers: list) -> dict:
+    """Latest price plus 5d hourly closes for each ticker, fetched in batches."""
+    snapshot = {}
+    url = "https://query1.finance.yahoo.com/v7/finance/spark"
+    for start in range(0, len(tickers), STOCK_BATCH_SIZE):
+        chunk = tickers[start:start + STOCK_BATCH_SIZE]
+        try:
+            data = get_json(url, {
+                "symbols":  ",".join(chunk),
+                "range":    "5d",
+                "interval": "1h",
+            }, timeout=15)
+            now = time.time()
+            for result in (data.get("spark") or {}).get("result") or []:
+                response = (result.get("response") or [{}])[0]
+                price = (response.get("meta") or {}).get("regularMarketPrice")
+                if price is None or price <= 0:
+                    continue
+                quote = ((response.get("indicators") or {}).get("quote") or [{}])[0]
+                closes = [c for c in quote.get("close") or [] if c is not None]
+                snapshot[result["symbol"]] = {"price": price, "sparkline": closes, "updated": now}
+        except urllib.error.HTTPError as e:
+            print(f"Warning: Yahoo API error ({e.code})")
+        except Exception:
+            traceback.print_exc()
+    return snapshot
+
+def load_snapshot(args, previous: dict) -> dict:
+    """Return {symbol: {"price": float, "sparkline": [...], "updated": ts}}.
+
+    Symbols missing from this run's data keep their previous snapshot.
+    """
+    if args.offline:
+        return {}
+    if args.snapshot:
+        with open(args.snapshot, "r", encoding="utf-8") as f:
+            fresh = json.load(f)
+    else:
+        fresh = fetch_crypto_snapshot(list(CRYPTO_ASSETS))
+        fresh.update(fetch_stock_snapshot(list(STOCK_ASSETS)))
+    missing = [s for s in list(CRYPTO_ASSETS) + list(STOCK_ASSETS) if s not in fresh]
+    if missing:
+        print(f"Warning: no fresh data for {', '.join(missing)}; keeping last good snapshot")
+    snapshot = dict(previous)
+    for symbol, data in fresh.items():
+        old = previous.get(symbol) or {}
+        # Unchanged data keeps its timestamp so the page is not rewritten
+        # (e.g. stocks over a weekend)
+        if old.get("price") == data.get("price") and old.get("sparkline") == data.get("sparkline"):
+            data = dict(data, updated=old.get("updated", data.get("updated")))
+        snapshot[symbol] = data
+    return snapshot
+
+
+# ── RENDERING ──────────────────────────────────────────────────────────────────
+def format_price(price: float) -> str:
+    # Mirrors formatPrice() in price.js so the refresh does not reflow the page
+    if price >= 1:
+        return f"${price:,.2f}"
+    s = f"{price:.8f}".rstrip("0").rstrip(".")
+    return f"${s}"
+
+def render_sparkline(values: list) -> str:
+    if len(values) < 2:
+        return ""
+    # Downsample to a fixed number of points to keep pages small
+    if len(values) > SPARKLINE_POINTS:
+        step = (len(values) - 1) / (SPARKLINE_POINTS - 1)
+        values = [values[round(i * step)] for i in range(SPARKLINE_POINTS)]
+    low, high = min(values), max(values)
+    span = (high - low) or 1
+    last = len(values) - 1
+    points = " ".join(
+        f"{i * 100 / last:.1f},{30 - (v - low) * 30 / span:.1f}"
+        for i, v in enumerate(values)
+    )
+    trend = "up" if values[-1] >= values[0] else "down"
+    return (
+        f'<svg class="sparkline sparkline-{trend}" viewBox="0 0 100 30" '
+        f'preserveAspectRatio="none" aria-hidden="true">'
+        f'<polyline points="{points}"/></svg>'
+    )
+
+def render_snapshot(data: dict) -> dict:
+    """Template fields for the baked price block of an asset page."""
+    if not data.get("price"):
+        return {
+            "price_html":     '<span class="loading">Loading price...</span>',
+            "sparkline_html": "",
+        }
+    price_html = f'<span class="price-value">{format_price(data["price"])}</span>'
+    if data.get("updated"):
+        # Baked prices can be old by the time the page is served; say so
+        as_of = datetime.fromtimestamp(data["updated"], timezone.utc)
+        price_html += f'\n                    <p class="price-updated">as of {as_of:%d %b %Y %H:%M} UTC</p>'
+    return {
+        "price_html":     price_html,
+        "sparkline_html": render_sparkline(data.get("sparkline") or []),
+    }
+
+def iter_asset_pages():
+    """Yield (output path, symbol, HTML-escaped template fields without data/asset fields)."""
+    esc = html.escape
+    for coin_id, (name, ticker) in CRYPTO_ASSETS.items():
+        yield os.path.join(FRONTEND_DIR, "coins", f"{coin_id}.html"), coin_id, {
+            "symbol":     esc(coin_id),
+            "asset_type": "crypto",
+            "name":       esc(name),
+            "ticker":     esc(ticker),
+            "list_page":  "crypto.html",
+            "list_label": "Crypto List",
+        }
+    for ticker, name in STOCK_ASSETS.items():
+        yield os.path.join(FRONTEND_DIR, "stocks", f"{ticker.lower()}.html"), ticker, {
+            "symbol":     esc(ticker),
+            "asset_type": "stock",
+            "name":       esc(name),
+            "ticker":     esc(ticker),
+            "list_page":  "stocks.html",
+            "list_label": "Stock List",
+        }
+
+def render_list_items() -> dict:
+    """Grid entries for crypto.html and stocks.html."""
+    esc = html.escape
+    item = Template(
+        '                <a href="$href" class="crypto-btn" $attr="$symbol">\n'
+        '                    <span class="crypto-icon">$icon</span>\n'
+        '                    <span class="crypto-name">$label</span>\n'
+        '                </a>'
+    )
+    crypto = [
+        item.substitute(href=esc(f"coins/{cid}.html"), attr="data-crypto", symbol=esc(cid),
+                        icon=esc(ASSET_ICONS.get(cid, ticker)), label=esc(name))
+        for cid, (name, ticker) in CRYPTO_ASSETS.items()
+    ]
+    stocks = [
+        item.substitute(href=esc(f"stocks/{ticker.lower()}.html"), attr="data-stock", symbol=esc(ticker),
+                        icon=esc(ASSET_ICONS.get(ticker, ticker)), label=esc(f"{name} ({ticker})"))
+        for ticker, name in STOCK_ASSETS.items()
+    ]
+    return {
+        "crypto.html": "\n                \n".join(crypto),
+        "stocks.html": "\n                \n".join(stocks),
+    }
+
+def load_manifest() -> dict:
+    try:
+        with open(MANIFEST, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"pages": {}, "snapshot": {}}
+    return {"pages": manifest.get("pages", {}), "snapshot": manifest.get("snapshot", {})}
+
+def save_manifest(manifest: dict):
+    tmp_path = MANIFEST + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST)
+
+def read_template(name: str):
+    """Return (Template, sha256 of its source)."""
+    with open(os.path.join(TEMPLATES_DIR, name), "r", encoding="utf-8") as f:
+        source = f.read()
+    return Template(source), hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the frontend landing, list and asset pages.")
+    parser.add_argument("--offline", action="store_true",
+                        help="do not fetch prices; pages show the loading state")
+    parser.add_argument("--snapshot", metavar="FILE",
+                        help="read the price snapshot from a JSON file instead of fetching it")
+    parser.add_argument("--force", action="store_true",
+                        help="rewrite every page even if its inputs are unchanged")
+    args = parser.parse_args()
+
+    assets = build_shared_assets()
+    manifest = load_manifest()
+    snapshot = load_snapshot(args, manifest["snapshot"])
+    old_digests = {} if args.force else manifest["pages"]
+    new_digests = {}
+    written = 0
+
+    def render(path: str, template, template_hash: str, fields: dict):
+        nonlocal written
+        rel_path = os.path.relpath(path, FRONTEND_DIR)
+        inputs = json.dumps({"template": template_hash, "fields": fields}, sort_keys=True)
+        digest = hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+        new_digests[rel_path] = digest
+        if old_digests.get(rel_path) == digest and os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(template.substitute(fields))
+        written += 1
+        print(f"Rendered {rel_path}")
+
+    asset_template, asset_hash = read_template("asset.html")
+    for path, symbol, fields in iter_asset_pages():
+        render(path, asset_template, asset_hash, dict(
+            fields,
+            style_css=assets["style.css"],
+            script_js=assets["script.js"],
+            price_js=assets["price.js"],
+            **render_snapshot(snapshot.get(symbol) or {}),
+        ))
+
+    for name, items in render_list_items().items():
+        template, template_hash = read_template(name)
+        render(os.path.join(FRONTEND_DIR, name), template, template_hash,
+               {"style_css": assets["style.css"], "items": items})
+
+    template, template_hash = read_template("index.html")
+    render(os.path.join(FRONTEND_DIR, "index.html"), template, template_hash,
+           {"style_css": assets["style.css"]})
+
+    # --offline renders without prices but keeps the last good snapshot around
+    save_manifest({"pages": new_digests, "snapshot": manifest["snapshot"] if args.offline else snapshot})
+    total = len(new_digests)
+    print(f"\n{written}/{total} pages rendered ({total - written} unchanged)")
+
+if __name__ == "__main__":
+    main()